@@ -6,7 +6,7 @@ hydrological time series (such as water level and rainfall),
 including:
 
 * Dataclasses for configuration (input, QC rules, outputs).
-* Helpers for reading time series CSVs into pandas.
+* Helpers for reading and writing time series CSVs with pandas.
 * Implementations of QC rules (range, stuck sensor, spike, step rate).
 * Plotting and report helpers used by the CLI.
 
@@ -17,25 +17,69 @@ programmatic use in tests, notebooks, or downstream tooling.
 
 from __future__ import annotations
 
+import importlib
 from importlib import metadata
-from typing import List
-
-from hydxc.config import (
-    DataConfig,
-    QCConfig,
-    RangeConfig,
-    SpikeMadConfig,
-    StepConfig,
-    StuckConfig,
-)
-from hydxc.io import read_ts, ensure_dir
-from hydxc import rules
-
-# Try to obtain the installed package version, falling back for dev checkouts.
-try:
-    __version__: str = metadata.version("hydro-qc-toolkit")
-except metadata.PackageNotFoundError:  # pragma: no cover - dev fallback
-    __version__ = "0.0.0+dev"
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from hydxc.config import (
+        DataConfig,
+        QCConfig,
+        RangeConfig,
+        SpikeMadConfig,
+        StepConfig,
+        StuckConfig,
+    )
+    from hydxc.io import read_ts, ensure_dir, ensure_parents, write_csv
+    from hydxc import rules
+
+    __version__: str
+
+# Public symbols are imported on first access (PEP 562) so that importing
+# the package, e.g. for ``hydxc --help``, does not pull in pandas, numpy or
+# matplotlib up front. Maps attribute name -> defining module.
+_LAZY_ATTRS: Dict[str, str] = {
+    "DataConfig": "hydxc.config",
+    "QCConfig": "hydxc.config",
+    "RangeConfig": "hydxc.config",
+    "StuckConfig": "hydxc.config",
+    "SpikeMadConfig": "hydxc.config",
+    "StepConfig": "hydxc.config",
+    "read_ts": "hydxc.io",
+    "ensure_dir": "hydxc.io",
+    "ensure_parents": "hydxc.io",
+    "write_csv": "hydxc.io",
+}
+
+
+def _get_version() -> str:
+    """Return the installed package version, falling back for dev checkouts."""
+    try:
+        return metadata.version("hydro-qc-toolkit")
+    except metadata.PackageNotFoundError:  # pragma: no cover - dev fallback
+        return "0.0.0+dev"
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve lazily imported public symbols on first access."""
+    if name == "__version__":
+        value: Any = _get_version()
+    elif name == "rules":
+        value = importlib.import_module("hydxc.rules")
+    elif name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache on the module so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazily imported symbols in ``dir(hydxc)``."""
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__: List[str] = [
     "__version__",
@@ -49,6 +93,8 @@ __all__: List[str] = [
     # IO helpers
     "read_ts",
     "ensure_dir",
+    "ensure_parents",
+    "write_csv",
     # QC rules module
     "rules",
 ]
@@ -20,23 +20,33 @@ from __future__ import annotations
 import argparse
 import os
 import re
-from typing import Dict, Iterable, List, Tuple, Match, cast
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Tuple,
+    cast,
+)
 
-import pandas as pd
-import plotille
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 from rich_argparse import RichHelpFormatter
-from tqdm import tqdm
 
 from hydxc.config import QCConfig, load_config
-from hydxc.io import read_ts, ensure_dir
-from hydxc import rules
-from hydxc.plotting import plot_series_with_flags
-from hydxc.report import generate_summary
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    import pandas as pd
+
+# pandas, numpy, matplotlib, plotille and tqdm are imported inside the
+# functions that need them, so ``hydro-qc --help`` and argument errors
+# return without paying for those imports.
 
 # Console with a simple theme for status messages.
 custom_theme = Theme(
@@ -50,15 +60,40 @@ custom_theme = Theme(
 )
 console: Console = Console(theme=custom_theme)
 
-# Map flag codes to human-readable labels.
+
+def _plain_console() -> Console:
+    """
+    Return a console that prints without colour or syntax highlighting.
+
+    Markup tags such as ``[info]`` are still parsed (and stripped) so
+    messages read the same, just uncoloured.
+    """
+    return Console(
+        theme=custom_theme,
+        no_color=True,
+        highlight=False,
+        emoji=False,
+    )
+
+
+# Map flag codes to human-readable labels. Keys mirror the ``FLAG_*``
+# constants in :mod:`hydxc.rules`, spelled out here so that importing the
+# CLI does not import the rules module (and with it pandas).
 FLAG_LABELS: Dict[int, str] = {
-    rules.FLAG_OK: "OK",
-    rules.FLAG_RANGE: "Range",
-    rules.FLAG_STUCK: "Stuck sensor",
-    rules.FLAG_SPIKE: "Spike (MAD)",
-    rules.FLAG_STEP: "Step rate",
+    0: "OK",
+    1: "Range",
+    2: "Stuck sensor",
+    3: "Spike (MAD)",
+    4: "Step rate",
 }
 
+# Numeric tokens (axis numbers, tick labels) in the terminal chart preview.
+_NUM_RE: re.Pattern[str] = re.compile(r"-?\d+(?:\.\d+)?")
+
+# Previews longer than this many characters are printed without numeric
+# token styling; the per-token stylize calls dominate on huge plots.
+_MAX_STYLED_PREVIEW_CHARS: int = 200_000
+
 
 def build_parser() -> argparse.ArgumentParser:
     """
@@ -83,13 +118,22 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--no-progress",
         action="store_true",
-        help="Disable progress bars (for very quiet or non-TTY runs).",
+        help=(
+            "Disable progress bars (for very quiet or non-TTY runs). The "
+            "per-rule bar is only shown when Numba is not installed; with "
+            "Numba all rules run in one compiled pass with no progress bar."
+        ),
     )
     parser.add_argument(
         "--no-chart-preview",
         action="store_true",
         help="Disable inline terminal chart preview.",
     )
+    parser.add_argument(
+        "--plain",
+        action="store_true",
+        help="Print plain, uncoloured output (for logs and CI).",
+    )
     return parser
 
 
@@ -111,9 +155,9 @@ def _print_header(config_path: str) -> None:
     )
 
 
-def _print_dataset_summary(df: pd.DataFrame, value_col: str) -> None:
+def _dataset_summary_table(df: pd.DataFrame, value_col: str) -> Table:
     """
-    Print a short summary of the input dataset.
+    Build a short summary table of the input dataset.
 
     Parameters
     ----------
@@ -121,6 +165,11 @@ def _print_dataset_summary(df: pd.DataFrame, value_col: str) -> None:
         The input time series dataframe (indexed by timestamp).
     value_col
         Name of the primary value column being QC-checked.
+
+    Returns
+    -------
+    rich.table.Table
+        Table ready to be printed to the console.
     """
     table = Table(title="Input dataset", show_lines=True)
     table.add_column("Property", style="cyan", no_wrap=True)
@@ -129,21 +178,32 @@ def _print_dataset_summary(df: pd.DataFrame, value_col: str) -> None:
     table.add_row("Index type", type(df.index).__name__)
     table.add_row("Samples", str(len(df)))
     if not df.empty:
-        table.add_row("Start", str(df.index.min()))
-        table.add_row("End", str(df.index.max()))
+        # read_ts returns a sorted index, whose ends are its min and max;
+        # is_monotonic_increasing is cached from that sort check.
+        if df.index.is_monotonic_increasing:
+            start, end = df.index[0], df.index[-1]
+        else:
+            start, end = df.index.min(), df.index.max()
+        table.add_row("Start", str(start))
+        table.add_row("End", str(end))
     table.add_row("Value column", value_col)
 
-    console.print(table)
+    return table
 
 
-def _print_rule_config(cfg: QCConfig) -> None:
+def _rule_config_table(cfg: QCConfig) -> Table:
     """
-    Print which QC rules are enabled and their key parameters.
+    Build a table of which QC rules are enabled and their key parameters.
 
     Parameters
     ----------
     cfg
         Parsed QC configuration dataclass instance.
+
+    Returns
+    -------
+    rich.table.Table
+        Table ready to be printed to the console.
     """
     table = Table(title="QC rules", show_lines=True)
     table.add_column("Rule", style="cyan", no_wrap=True)
@@ -173,7 +233,7 @@ def _print_rule_config(cfg: QCConfig) -> None:
         f"max_change_per_step={cfg.step_rate.max_change_per_step}",
     )
 
-    console.print(table)
+    return table
 
 
 def _preview_chart_terminal(df: pd.DataFrame, value_col: str) -> None:
@@ -194,16 +254,20 @@ def _preview_chart_terminal(df: pd.DataFrame, value_col: str) -> None:
         console.print("[warning]No data available for terminal plot.[/warning]")
         return
 
+    import numpy as np
+    import plotille
+
     max_points: int = 200
-    if len(df) > max_points:
-        view = df.iloc[:max_points]
-        truncated = True
-    else:
-        view = df
-        truncated = False
+    n_samples: int = len(df)
+    # Take every ``step``-th sample so long records keep their overall
+    # shape in the preview instead of showing only the first few hours.
+    step: int = -(-n_samples // max_points)
+    view = df.iloc[::step] if step > 1 else df
+    downsampled = step > 1
 
-    y_vals = view[value_col].astype(float).to_list()
-    x_vals = list(range(len(y_vals)))
+    y_arr = view[value_col].to_numpy(dtype=np.float64, copy=False)
+    y_vals = y_arr.tolist()
+    x_vals = list(range(0, n_samples, step))
 
     fig: plotille.Figure = plotille.Figure()
     fig.width = 80
@@ -215,7 +279,7 @@ def _preview_chart_terminal(df: pd.DataFrame, value_col: str) -> None:
     # plotille is untyped, so we ignore the "partially unknown" warning here.
     fig.set_x_limits(  # type: ignore[reportUnknownMemberType]
         min_=0,
-        max_=len(x_vals) - 1,
+        max_=x_vals[-1],
     )
     fig.plot(  # type: ignore[reportUnknownMemberType]
         x_vals,
@@ -240,17 +304,19 @@ def _preview_chart_terminal(df: pd.DataFrame, value_col: str) -> None:
     plain: str = text.plain
 
     # Style numeric tokens (axis numbers, tick labels) as bold white.
-    for match in re.finditer(r"-?\d+(?:\.\d+)?", plain):
-        match_span: Match[str] = match
-        start, end = match_span.span()
-        text.stylize("bold white", start, end)
+    if len(plain) <= _MAX_STYLED_PREVIEW_CHARS:
+        spans: List[Tuple[int, int]] = [
+            match.span() for match in _NUM_RE.finditer(plain)
+        ]
+        for start, end in spans:
+            text.stylize("bold white", start, end)
 
     console.print(text)
 
-    if truncated:
+    if downsampled:
         console.print(
-            "[warning]Preview truncated to first "
-            f"{max_points} samples for readability.[/warning]"
+            f"[warning]Preview downsampled to one in every {step} of "
+            f"{n_samples} samples for readability.[/warning]"
         )
 
 
@@ -267,16 +333,16 @@ def _print_flag_summary(df: pd.DataFrame) -> None:
         console.print("[warning]No qc_flag column to summarise.[/warning]")
         return
 
-    total: int = int(len(df))
+    import numpy as np
 
-    # Build a typed dict[int, int] from value_counts() in a way Pylance likes.
-    value_counts = df["qc_flag"].value_counts()
+    from hydxc import rules
+
+    total: int = int(len(df))
 
-    counts: Dict[int, int] = {}
-    for key, count_val in value_counts.items():
-        # Pylance sees key as Hashable; assert it is int-like.
-        int_key = cast(int, key)
-        counts[int_key] = int(count_val)
+    # Flag codes are small non-negative ints, so a bincount gives every
+    # code's count in one linear pass without hashing.
+    codes = df["qc_flag"].to_numpy()
+    counts_arr = np.bincount(codes, minlength=max(FLAG_LABELS) + 1)
 
     table = Table(title="QC flag summary", show_lines=True)
     table.add_column("Code", style="cyan", no_wrap=True)
@@ -286,13 +352,13 @@ def _print_flag_summary(df: pd.DataFrame) -> None:
 
     for code in sorted(FLAG_LABELS.keys()):
         label = FLAG_LABELS.get(code, f"Unknown ({code})")
-        count: int = counts.get(code, 0)
+        count: int = int(counts_arr[code])
         pct: float = 100.0 * count / total if total else 0.0
         table.add_row(str(code), label, str(count), f"{pct:5.1f}%")
 
     console.print(table)
 
-    ok_count: int = counts.get(rules.FLAG_OK, 0)
+    ok_count: int = int(counts_arr[rules.FLAG_OK])
     flagged: int = total - ok_count
 
     if flagged == 0:
@@ -307,6 +373,107 @@ def _print_flag_summary(df: pd.DataFrame) -> None:
         )
 
 
+def _apply_rules_concurrently(
+    series: pd.Series,
+    cfg: QCConfig,
+    active_rule_names: List[str],
+    show_progress: bool,
+) -> pd.Series:
+    """
+    Apply the active QC rules one Series each, in a thread pool.
+
+    Used when the compiled single-pass kernel in
+    :func:`hydxc.rules.apply_all_checks` is unavailable (Numba is not
+    installed).
+
+    Parameters
+    ----------
+    series
+        Values to check; shared read-only by all rules.
+    cfg
+        Parsed QC configuration dataclass instance.
+    active_rule_names
+        Names of the enabled rules, in display order.
+    show_progress
+        Whether to show a tqdm progress bar over completed rules.
+
+    Returns
+    -------
+    pandas.Series
+        Combined flags (elementwise maximum), aligned to ``series.index``.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from hydxc import rules
+
+    # Rule name -> (rule function, positional arguments).
+    rule_map: Dict[str, Tuple[Callable[..., pd.Series], Tuple[Any, ...]]] = {
+        "Range check": (
+            rules.apply_range_check,
+            (series, cfg.range_check.min, cfg.range_check.max),
+        ),
+        "Stuck sensor": (
+            rules.apply_stuck_sensor,
+            (series, cfg.stuck_sensor.window, cfg.stuck_sensor.tolerance),
+        ),
+        "Spike MAD": (
+            rules.apply_spike_mad,
+            (series, cfg.spike_mad.window, cfg.spike_mad.threshold),
+        ),
+        "Step rate": (
+            rules.apply_step_rate,
+            (series, cfg.step_rate.max_change_per_step),
+        ),
+    }
+
+    # The rules are independent and spend most of their time in pandas /
+    # NumPy kernels that release the GIL, so run them concurrently.
+    # combine_flags takes an elementwise max, so completion order does not
+    # matter; results are still collected in rule order below.
+    results: Dict[str, pd.Series] = {}
+    if active_rule_names:
+        with ThreadPoolExecutor(max_workers=len(active_rule_names)) as pool:
+            futures: Dict[Future[pd.Series], str] = {}
+            for name in active_rule_names:
+                rule_fn, rule_args = rule_map[name]
+                futures[pool.submit(rule_fn, *rule_args)] = name
+
+            done_iter: Iterable[Future[pd.Series]] = as_completed(futures)
+            if show_progress:
+                from tqdm import tqdm
+
+                done_iter = tqdm(
+                    done_iter,
+                    total=len(futures),
+                    desc="QC rules",
+                    unit="rule",
+                )
+
+            for future in done_iter:
+                results[futures[future]] = future.result()
+
+    flag_series_list: List[pd.Series] = [
+        results[name] for name in active_rule_names
+    ]
+
+    if flag_series_list:
+        # Codes are non-negative, so reinterpret the int8 result as uint8.
+        combined = rules.combine_flags(*flag_series_list)
+        combined_flags = pd.Series(
+            combined.to_numpy().view(np.uint8),
+            index=series.index,
+        )
+    else:
+        combined_flags = pd.Series(
+            data=rules.FLAG_OK,
+            index=series.index,
+            dtype="uint8",
+        )
+
+    return combined_flags
+
+
 def main() -> None:
     """
     Run the Hydro QC command-line interface.
@@ -323,9 +490,21 @@ def main() -> None:
     It is intended to be used as the entry point for the ``hydro-qc``
     console script.
     """
+    global console
+
     parser = build_parser()
     args = parser.parse_args()
 
+    if args.plain:
+        console = _plain_console()
+
+    import pandas as pd
+
+    from hydxc.io import read_ts, ensure_parents, write_csv
+    from hydxc import rules
+    from hydxc.plotting import plot_series_with_flags
+    from hydxc.report import generate_summary
+
     _print_header(args.config)
 
     console.print("[info]Loading configuration...[/info]")
@@ -344,10 +523,13 @@ def main() -> None:
         )
         raise SystemExit(1)
 
-    _print_dataset_summary(df, value_col)
-    _print_rule_config(cfg)
-
-    flag_series_list: List[pd.Series] = []
+    # Render both tables in a single print call.
+    console.print(
+        Group(
+            _dataset_summary_table(df, value_col),
+            _rule_config_table(cfg),
+        )
+    )
 
     candidates: List[Tuple[str, bool]] = [
         ("Range check", cfg.range_check.enabled),
@@ -365,48 +547,29 @@ def main() -> None:
             "all data will be flagged as OK.[/warning]"
         )
 
-    console.print("\n[step]Applying QC rules...[/step]")
-    if args.no_progress:
-        rule_iter: Iterable[str] = active_rule_names
-    else:
-        rule_iter = tqdm(active_rule_names, desc="QC rules", unit="rule")
-
-    for rule_name in rule_iter:
-        if rule_name == "Range check":
-            fs = rules.apply_range_check(
-                df[value_col],
-                cfg.range_check.min,
-                cfg.range_check.max,
-            )
-        elif rule_name == "Stuck sensor":
-            fs = rules.apply_stuck_sensor(
-                df[value_col],
-                cfg.stuck_sensor.window,
-                cfg.stuck_sensor.tolerance,
-            )
-        elif rule_name == "Spike MAD":
-            fs = rules.apply_spike_mad(
-                df[value_col],
-                cfg.spike_mad.window,
-                cfg.spike_mad.threshold,
-            )
-        elif rule_name == "Step rate":
-            fs = rules.apply_step_rate(
-                df[value_col],
-                cfg.step_rate.max_change_per_step,
-            )
-        else:
-            continue
-
-        flag_series_list.append(fs)
+    # Look the column up once; every rule reads this same Series, which is
+    # only read (never mutated) so it is safe to share across threads.
+    series: pd.Series = df[value_col]
 
-    if flag_series_list:
-        combined_flags = rules.combine_flags(*flag_series_list)
-    else:
+    # Flag codes are small non-negative ints; storing them as uint8 cuts
+    # memory and bandwidth for the summary, CSV and plotting passes 8x.
+    # Both paths below produce uint8 flags, so no cast is needed here.
+    console.print("\n[step]Applying QC rules...[/step]")
+    if rules.HAVE_NUMBA:
+        # One compiled pass evaluates every enabled rule and writes the
+        # combined flags directly, without a flag Series per rule. Its
+        # int8 codes are reinterpreted as uint8 without a copy.
+        fused = rules.apply_all_checks(series, cfg)
         combined_flags = pd.Series(
-            data=rules.FLAG_OK,
-            index=df.index,
-            dtype="int64",
+            fused.to_numpy().view("uint8"),
+            index=series.index,
+        )
+    else:
+        combined_flags = _apply_rules_concurrently(
+            series,
+            cfg,
+            active_rule_names,
+            show_progress=not args.no_progress,
         )
 
     df["qc_flag"] = combined_flags
@@ -415,13 +578,17 @@ def main() -> None:
     _print_flag_summary(df)
 
     console.print("\n[step]Writing outputs to disk...[/step]")
-    ensure_dir(cfg.output.flags_csv)
-    ensure_dir(cfg.output.combined_csv)
-    ensure_dir(os.path.join(cfg.output.charts_dir, "dummy.txt"))
-    ensure_dir(cfg.output.report_path)
+    ensure_parents(
+        cfg.output.flags_csv,
+        cfg.output.combined_csv,
+        cfg.output.report_path,
+    )
+    if cfg.output.charts_dir:
+        # "" means the working directory, which needs no creating.
+        os.makedirs(cfg.output.charts_dir, exist_ok=True)
 
-    df[["qc_flag"]].to_csv(cfg.output.flags_csv)
-    df.to_csv(cfg.output.combined_csv)
+    write_csv(df["qc_flag"], cfg.output.flags_csv)
+    write_csv(df, cfg.output.combined_csv)
 
     chart_path = plot_series_with_flags(
         df=df,
@@ -8,18 +8,45 @@ This module defines small dataclasses that capture:
 * Output configuration (paths for flags, combined CSV, charts, summary).
 
 It also provides a `load_config` helper that reads a YAML file and
-returns a fully-populated `QCConfig` instance.
+returns a fully-populated `QCConfig` instance, caching the parsed result
+next to the YAML file so repeated runs skip parsing.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+import json
+import os
+import warnings
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Mapping, Optional
 
 import yaml
 
+# Suffix and format tag for the parsed-config cache sidecar. Bump the tag
+# whenever the cached fields change so older sidecars are ignored.
+_CACHE_SUFFIX: str = ".cache.json"
+_CACHE_FORMAT: int = 1
+
+# Prefer PyYAML's libyaml-backed loader; it has the same semantics as
+# SafeLoader but parses several times faster.
+_YamlLoader: Any = getattr(yaml, "CSafeLoader", None)
+if _YamlLoader is None:  # pragma: no cover - depends on PyYAML build
+    _YamlLoader = yaml.SafeLoader
+    warnings.warn(
+        "PyYAML was built without libyaml; falling back to the slower "
+        "pure-Python SafeLoader. Install libyaml (e.g. libyaml-dev) and "
+        "reinstall PyYAML for faster config loading.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+# Configs at least this large are read from the composed YAML node graph,
+# constructing only the values that are actually looked up. Smaller files
+# are cheaper to load whole.
+_COMPOSE_MIN_BYTES: int = 1024
+
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class RangeConfig:
     """Configuration for the range check QC rule."""
 
@@ -28,7 +55,7 @@ class RangeConfig:
     max: float
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StuckConfig:
     """Configuration for the stuck sensor QC rule."""
 
@@ -37,7 +64,7 @@ class StuckConfig:
     tolerance: float
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class SpikeMadConfig:
     """Configuration for the spike detection (MAD-based) QC rule."""
 
@@ -46,7 +73,7 @@ class SpikeMadConfig:
     threshold: float
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class StepConfig:
     """Configuration for the step-rate QC rule."""
 
@@ -54,7 +81,7 @@ class StepConfig:
     max_change_per_step: float
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class DataConfig:
     """Configuration for input data and time-series parsing."""
 
@@ -64,9 +91,10 @@ class DataConfig:
     rainfall_column: Optional[str]
     datetime_format: Optional[str]
     timezone: Optional[str]
+    chunksize: Optional[int] = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class OutputConfig:
     """Configuration for QC outputs (files and labels)."""
 
@@ -77,7 +105,7 @@ class OutputConfig:
     station_name: str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class QCConfig:
     """Top-level QC configuration, as loaded from YAML."""
 
@@ -89,6 +117,59 @@ class QCConfig:
     output: OutputConfig
 
 
+class _NodeMapping(Mapping[Any, Any]):
+    """Read-only mapping over a YAML mapping node, built on access."""
+
+    __slots__ = ("_loader", "_nodes")
+
+    def __init__(self, loader: Any, node: yaml.MappingNode) -> None:
+        # Resolve ``<<`` merge keys the same way yaml.load would.
+        loader.flatten_mapping(node)
+        self._loader = loader
+        self._nodes: Dict[Any, yaml.Node] = {
+            loader.construct_object(key_node, deep=True): value_node
+            for key_node, value_node in node.value
+        }
+
+    def __getitem__(self, key: Any) -> Any:
+        return _construct_node(self._loader, self._nodes[key])
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+
+def _construct_node(loader: Any, node: yaml.Node) -> Any:
+    """Build the Python value for ``node``, keeping mappings lazy."""
+    if isinstance(node, yaml.MappingNode):
+        return _NodeMapping(loader, node)
+    return loader.construct_object(node, deep=True)
+
+
+def _load_yaml(file: Any) -> Any:
+    """
+    Load the YAML document in ``file``.
+
+    Small files go through :func:`yaml.load`. Larger ones are composed
+    into a node graph and wrapped in lazy mappings, so only the sections
+    and keys the config loader reads are turned into Python objects,
+    instead of first building the whole document as nested dicts.
+    """
+    if os.fstat(file.fileno()).st_size < _COMPOSE_MIN_BYTES:
+        return yaml.load(file, Loader=_YamlLoader)
+
+    loader = _YamlLoader(file)
+    try:
+        root = loader.get_single_node()
+    finally:
+        loader.dispose()
+    if root is None:
+        return None
+    return _construct_node(loader, root)
+
+
 def _require_section(raw: Mapping[str, Any], key: str) -> Mapping[str, Any]:
     """Return a mapping for a required top-level section or raise a KeyError."""
     try:
@@ -96,16 +177,33 @@ def _require_section(raw: Mapping[str, Any], key: str) -> Mapping[str, Any]:
     except KeyError as exc:
         raise KeyError(f"Missing required top-level section '{key}' in config") from exc
 
+    # YAML loaders return plain dicts; the exact type check avoids the
+    # slower Mapping ABC instance check in the common case.
+    if type(section) is dict:
+        return section # pyright: ignore[reportUnknownVariableType]
     if not isinstance(section, Mapping):
         raise TypeError(f"Config section '{key}' must be a mapping/dict")
 
     return section # pyright: ignore[reportUnknownVariableType]
 
 
+def _optional_int(value: Any) -> Optional[int]:
+    """Return ``value`` as an int, or ``None`` if it is unset."""
+    if value is None:
+        return None
+    return int(value)
+
+
 def load_config(path: str) -> QCConfig:
     """
     Load QC configuration from a YAML file.
 
+    Parsed configurations are cached in a JSON sidecar next to the YAML
+    file (``<path>.cache.json``) as plain field values, keyed by a cache
+    format tag, the package version and the file's modification time and
+    size. While all of these match, later loads skip parsing and rebuild
+    the :class:`QCConfig` from the cached values.
+
     The YAML file is expected to contain three top-level mappings:
 
     * ``data``   – parsed into :class:`DataConfig`
@@ -134,10 +232,71 @@ def load_config(path: str) -> QCConfig:
     yaml.YAMLError
         If the YAML file cannot be parsed.
     """
+    stat = os.stat(path)
+    cache_path = f"{path}{_CACHE_SUFFIX}"
+    key = _cache_key(stat)
+
+    cached = _read_cached_config(cache_path, key)
+    if cached is not None:
+        return cached
+
+    cfg = _parse_config(path)
+    _write_cached_config(cache_path, key, cfg)
+    return cfg
+
+
+def _cache_key(stat: os.stat_result) -> List[Any]:
+    """Return the key a cache sidecar must carry to be used for ``stat``."""
+    from hydxc import __version__
+
+    return [_CACHE_FORMAT, __version__, stat.st_mtime_ns, stat.st_size]
+
+
+def _read_cached_config(
+    cache_path: str, key: List[Any]
+) -> Optional[QCConfig]:
+    """Return the cached config if its key matches ``key``, else ``None``."""
+    try:
+        with open(cache_path, "rb") as file:
+            cached = json.load(file)
+        if cached["key"] != key:
+            return None
+        return _config_from_dict(cached["config"])
+    except (OSError, ValueError, KeyError, TypeError):
+        # Missing, unreadable, or malformed cache; parse the YAML.
+        return None
+
+
+def _write_cached_config(
+    cache_path: str, key: List[Any], cfg: QCConfig
+) -> None:
+    """Write ``cfg`` to the cache sidecar, ignoring unwritable locations."""
+    try:
+        with open(cache_path, "w", encoding="utf-8") as file:
+            json.dump({"key": key, "config": asdict(cfg)}, file)
+    except OSError:
+        # Caching is best-effort; a read-only config dir is fine.
+        pass
+
+
+def _config_from_dict(raw: Dict[str, Any]) -> QCConfig:
+    """Rebuild a :class:`QCConfig` from the field values in a cache file."""
+    return QCConfig(
+        data=DataConfig(**raw["data"]),
+        range_check=RangeConfig(**raw["range_check"]),
+        stuck_sensor=StuckConfig(**raw["stuck_sensor"]),
+        spike_mad=SpikeMadConfig(**raw["spike_mad"]),
+        step_rate=StepConfig(**raw["step_rate"]),
+        output=OutputConfig(**raw["output"]),
+    )
+
+
+def _parse_config(path: str) -> QCConfig:
+    """Parse the YAML file at ``path`` into a :class:`QCConfig`."""
     with open(path, "r", encoding="utf-8") as file:
-        raw: Any = yaml.safe_load(file)
+        raw: Any = _load_yaml(file)
 
-    if not isinstance(raw, Mapping):
+    if type(raw) is not dict and not isinstance(raw, Mapping):
         raise TypeError("Top-level config must be a mapping/dict")
 
     data_section = _require_section(raw, "data") # pyright: ignore[reportUnknownArgumentType]
@@ -156,6 +315,7 @@ def load_config(path: str) -> QCConfig:
         rainfall_column=data_section.get("rainfall_column"),
         datetime_format=data_section.get("datetime_format"),
         timezone=data_section.get("timezone"),
+        chunksize=_optional_int(data_section.get("chunksize")),
     )
 
     range_cfg = RangeConfig(
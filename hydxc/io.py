@@ -4,17 +4,161 @@ Input/output helpers for the Hydro QC toolkit.
 This module provides small utility functions for:
 
 * Reading time series data from CSV into a pandas DataFrame.
+* Writing DataFrames back to CSV.
 * Ensuring that directories for output paths exist on disk.
 """
 
 from __future__ import annotations
 
+import csv
+import io
 import os
+from typing import TYPE_CHECKING, List, Tuple, Union
 
 import pandas as pd
 
 from hydxc.config import DataConfig
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pv = None
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    import pyarrow
+
+# Block size handed to Arrow's CSV reader; each block is parsed on its own
+# thread, so larger blocks mean fewer, bigger tasks.
+_ARROW_BLOCK_SIZE: int = 8 << 20
+
+# Timestamp units tried, coarsest first, when narrowing columns for the
+# CSV writer; Arrow writes 0, 3, 6 or 9 fractional digits respectively.
+_TIMESTAMP_UNITS: Tuple[str, ...] = ("s", "ms", "us", "ns")
+
+
+def _read_csv_arrow(cfg: DataConfig) -> pd.DataFrame:
+    """
+    Read the input CSV with PyArrow's multithreaded reader.
+
+    The time column is converted to timestamps while the file is parsed,
+    so no second pass with :func:`pandas.to_datetime` is needed.
+
+    Parameters
+    ----------
+    cfg
+        Configuration containing paths and column names for the input CSV.
+
+    Returns
+    -------
+    pandas.DataFrame
+        NumPy-backed DataFrame indexed by the parsed time column (not yet
+        sorted).
+    """
+    # Only called once read_ts has checked that PyArrow is installed.
+    assert pa is not None and pv is not None
+
+    read_options = pv.ReadOptions(
+        use_threads=True,
+        block_size=_ARROW_BLOCK_SIZE,
+    )
+    convert_options = pv.ConvertOptions(
+        column_types={cfg.time_column: pa.timestamp("ns")},
+        timestamp_parsers=(
+            [cfg.datetime_format] if cfg.datetime_format else None
+        ),
+    )
+    table = pv.read_csv(
+        cfg.input_csv,
+        read_options=read_options,
+        convert_options=convert_options,
+    )
+    return table.to_pandas().set_index(cfg.time_column)
+
+
+def _read_csv_pandas(cfg: DataConfig) -> pd.DataFrame:
+    """
+    Read the input CSV with pandas, parsing and indexing the time column.
+
+    Timestamps are parsed by the CSV reader itself in the same pass that
+    builds the index; ``cache_dates`` converts each distinct timestamp
+    string only once.
+
+    Parameters
+    ----------
+    cfg
+        Configuration containing paths and column names for the input CSV.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame indexed by the parsed time column (not yet sorted).
+    """
+    df = pd.read_csv(  # type: ignore[reportGeneralTypeIssues]
+        cfg.input_csv,
+        parse_dates=[cfg.time_column],
+        date_format=cfg.datetime_format,
+        cache_dates=True,
+        index_col=cfg.time_column,
+    )
+
+    if not isinstance(df.index, pd.DatetimeIndex):
+        # read_csv leaves timestamps it cannot parse as strings; convert
+        # explicitly so malformed input raises a clear error.
+        df.index = pd.to_datetime(df.index, format=cfg.datetime_format)
+
+    return df
+
+
+def _read_csv_chunked(cfg: DataConfig) -> pd.DataFrame:
+    """
+    Read the input CSV in chunks of ``cfg.chunksize`` rows.
+
+    Each chunk has its time column parsed and set as the index before it
+    is kept, so only one raw chunk is held in the parser at a time.
+
+    Parameters
+    ----------
+    cfg
+        Configuration containing paths and column names for the input CSV.
+
+    Returns
+    -------
+    pandas.DataFrame
+        DataFrame indexed by the parsed time column (not yet sorted).
+    """
+    chunks: List[pd.DataFrame] = []
+    with pd.read_csv(  # type: ignore[reportGeneralTypeIssues]
+        cfg.input_csv,
+        chunksize=cfg.chunksize,
+        parse_dates=[cfg.time_column],
+        date_format=cfg.datetime_format,
+    ) as reader:
+        for chunk in reader:
+            chunks.append(chunk.set_index(cfg.time_column))
+
+    df = pd.concat(chunks)
+    if not isinstance(df.index, pd.DatetimeIndex):
+        # A chunk whose timestamps read_csv could not parse stays as
+        # strings (and makes the concatenated index object dtype); convert
+        # explicitly so malformed input raises a clear error.
+        df.index = pd.to_datetime(df.index, format=cfg.datetime_format)
+
+    return df
+
+
+def _sort_by_time(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Sort a time-indexed DataFrame, skipping the sort if already ordered.
+
+    Most sensor exports are already chronological; the monotonic check is
+    a single linear pass (cached on the index) versus a full sort.
+    """
+    if df.index.is_monotonic_increasing:
+        return df
+    return df.sort_index()
+
 
 def read_ts(cfg: DataConfig) -> pd.DataFrame:
     """
@@ -24,6 +168,12 @@ def read_ts(cfg: DataConfig) -> pd.DataFrame:
     provided configuration, and the resulting DataFrame is indexed by
     the timestamp column in ascending order.
 
+    When PyArrow is installed the file is read with its multithreaded
+    CSV reader; otherwise (or if Arrow cannot convert the time column)
+    pandas is used. If ``cfg.chunksize`` is set, the file is instead
+    streamed through pandas in chunks of that many rows to cap peak
+    memory on very large inputs.
+
     Parameters
     ----------
     cfg
@@ -34,18 +184,154 @@ def read_ts(cfg: DataConfig) -> pd.DataFrame:
     pandas.DataFrame
         A DataFrame indexed by the parsed time column and sorted by index.
     """
-    df = pd.read_csv(cfg.input_csv)  # type: ignore[reportGeneralTypeIssues]
-
-    if cfg.datetime_format:
-        df[cfg.time_column] = pd.to_datetime(
-            df[cfg.time_column],
-            format=cfg.datetime_format,
-        )
+    if cfg.chunksize:
+        df = _read_csv_chunked(cfg)
+    elif pa is not None:
+        try:
+            df = _read_csv_arrow(cfg)
+        except pa.ArrowInvalid:
+            # Timestamps Arrow cannot parse (e.g. non-ISO strings without
+            # an explicit format); let pandas infer them instead.
+            df = _read_csv_pandas(cfg)
     else:
-        df[cfg.time_column] = pd.to_datetime(df[cfg.time_column])
+        df = _read_csv_pandas(cfg)
 
-    df = df.set_index(cfg.time_column).sort_index()
-    return df
+    return _sort_by_time(df)
+
+
+def _coarsen_timestamps(table: pyarrow.Table) -> pyarrow.Table:
+    """
+    Narrow timestamp columns to the format :meth:`DataFrame.to_csv` uses.
+
+    pandas writes a datetime column as bare dates when every value is at
+    midnight, and otherwise with only as many fractional-second digits as
+    its finest value needs. Arrow writes every digit of the column's unit
+    (``00:00:00.000000``), so each column is cast to ``date32`` or to the
+    coarsest unit that holds its values exactly.
+    """
+    # Only called once write_csv has checked that PyArrow is installed.
+    assert pa is not None
+
+    for pos, field in enumerate(table.schema):
+        if not pa.types.is_timestamp(field.type):
+            continue
+        column = table.column(pos)
+        # The date32 cast truncates silently, so check it round-trips
+        # (nulls compare equal, and are written empty either way).
+        days = column.cast(pa.date32())
+        if days.cast(field.type).equals(column):
+            table = table.set_column(pos, field.name, days)
+            continue
+        for unit in _TIMESTAMP_UNITS:
+            if unit == field.type.unit:
+                break
+            try:
+                narrowed = column.cast(pa.timestamp(unit))
+            except pa.ArrowInvalid:
+                # Values finer than this unit; try the next one.
+                continue
+            table = table.set_column(pos, field.name, narrowed)
+            break
+    return table
+
+
+def _arrow_formats_like_pandas(frame: pd.DataFrame) -> bool:
+    """
+    Whether Arrow's CSV writer renders every column of ``frame`` as
+    :meth:`pandas.DataFrame.to_csv` does, apart from float formatting.
+
+    Integer, float and timezone-naive timestamp columns qualify. Arrow
+    writes bools as ``true``/``false``, quotes every string and writes
+    tz-aware timestamps with a ``Z``/``+hhmm`` suffix, so frames with such
+    columns are left to pandas, as are multi-level column headers (which
+    ``to_csv`` writes as several header rows). So is a single column with
+    missing values: Arrow writes those rows as blank lines, which CSV
+    readers skip, where pandas writes ``""``.
+    """
+    if isinstance(frame.columns, pd.MultiIndex):
+        return False
+    for dtype in frame.dtypes:
+        if isinstance(dtype, pd.DatetimeTZDtype) or dtype.kind not in "iufM":
+            return False
+    if len(frame.columns) == 1 and frame.iloc[:, 0].hasnans:
+        return False
+    return True
+
+
+def write_csv(
+    df: Union[pd.DataFrame, pd.Series],
+    path: str,
+    index: bool = True,
+) -> None:
+    """
+    Write a DataFrame (or a single named Series) to CSV.
+
+    When PyArrow is installed and every column is numeric or a naive
+    timestamp, its multithreaded C++ CSV writer is used, which is
+    considerably faster than pandas' formatter on large frames. Otherwise
+    this falls back to :meth:`pandas.DataFrame.to_csv`.
+
+    The Arrow output has the same header, integer and timestamp cells as
+    ``to_csv`` (timestamps are narrowed to bare dates or to the fewest
+    fractional digits that hold them, as pandas does). Floats differ in
+    notation only; Arrow writes its own shortest round-trip form:
+
+    * whole numbers lack the trailing ``.0`` (``1`` rather than ``1.0``);
+    * positional and exponent notation switch at other magnitudes
+      (``0.00001`` rather than ``1e-05``, ``9.4e+13`` rather than
+      ``94000000000000.0``);
+    * exponents are not zero-padded (``1e-8`` rather than ``1e-08``).
+
+    Every float parses back to the same value.
+
+    Parameters
+    ----------
+    df
+        DataFrame to write. A Series is written as a one-column CSV headed
+        by its name, without first copying it into a DataFrame.
+    path
+        Destination CSV path. Its parent directory must already exist.
+    index
+        Whether to write the index as the first column.
+    """
+    if pa is None or pv is None:
+        df.to_csv(path, index=index, header=True)
+        return
+
+    # Series.to_frame wraps the existing values without copying them.
+    frame = df.to_frame() if isinstance(df, pd.Series) else df
+    # Header as to_csv writes it: unnamed index levels get an empty name.
+    names = [str(name) for name in frame.columns]
+    if index:
+        levels = frame.index.names
+        names = ["" if name is None else str(name) for name in levels] + names
+        frame = frame.reset_index()
+    if not _arrow_formats_like_pandas(frame):
+        df.to_csv(path, index=index, header=True)
+        return
+
+    try:
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        df.to_csv(path, index=index, header=True)
+        return
+
+    # Arrow quotes every header name, so write the header with the csv
+    # module (quoting only names that need it, as pandas does) and the
+    # body with Arrow.
+    header = io.StringIO()
+    csv.writer(header, lineterminator="\n").writerow(names)
+
+    with open(path, "wb") as file:
+        file.write(header.getvalue().encode("utf-8"))
+        pv.write_csv(
+            _coarsen_timestamps(table),
+            file,
+            write_options=pv.WriteOptions(
+                include_header=False,
+                quoting_style="needed",
+            ),
+        )
 
 
 def ensure_dir(path: str) -> None:
@@ -68,3 +354,23 @@ def ensure_dir(path: str) -> None:
         return
 
     os.makedirs(dir_name, exist_ok=True)
+
+
+def ensure_parents(*paths: str) -> None:
+    """
+    Ensure that the parent directories of several file paths exist.
+
+    Paths sharing a parent directory only trigger a single
+    :func:`os.makedirs` call. Paths without a directory component are
+    skipped, as in :func:`ensure_dir`.
+
+    Parameters
+    ----------
+    *paths
+        File paths whose parent directories should be ensured.
+    """
+    dir_names = {os.path.dirname(path) for path in paths}
+    dir_names.discard("")
+
+    for dir_name in dir_names:
+        os.makedirs(dir_name, exist_ok=True)
@@ -8,13 +8,37 @@ time series data with QC flags overlaid, and saving them to disk.
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING, Tuple
 
-import matplotlib.pyplot as plt
-from matplotlib.axes import Axes
-from matplotlib.figure import Figure
 from pandas import DataFrame
 
-from hydxc.io import ensure_dir
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+
+
+def _new_axes() -> Tuple[Figure, Axes]:
+    """
+    Create a figure and axes for one chart.
+
+    The figure is built directly on an Agg canvas rather than through
+    :mod:`matplotlib.pyplot`: charts are only ever written to files, and
+    this leaves pyplot's figure registry and the user's selected backend
+    untouched. Without pyplot's bookkeeping a figure is cheap (a few
+    milliseconds), so every chart gets its own; reusing axes that pandas
+    has plotted on would carry its cached plot data into later charts.
+
+    Returns
+    -------
+    tuple
+        ``(figure, axes)`` ready for a new chart.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(10, 4))
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
 
 
 def plot_series_with_flags(
@@ -50,24 +74,28 @@ def plot_series_with_flags(
     str
         The filesystem path of the saved PNG chart.
     """
-    # Ensure the output directory exists.
-    ensure_dir(os.path.join(out_dir, "dummy.txt"))
+    # Ensure the output directory exists ("" is the working directory).
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
 
-    fig: Figure
-    ax: Axes
-    fig, ax = plt.subplots(figsize=(10, 4)) # pyright: ignore[reportUnknownMemberType]
+    fig, ax = _new_axes()
 
+    # The data artists are rasterized so dense series stay cheap to render
+    # and small on disk (also if saved to a vector format); the axes,
+    # labels and legend are unaffected.
     # pandas plotting wraps matplotlib; Pylance sometimes sees this as "partially unknown".
-    df[value_column].plot(ax=ax, label=value_column)  # type: ignore[reportUnknownMemberType]
+    df[value_column].plot(ax=ax, label=value_column, rasterized=True)  # type: ignore[reportUnknownMemberType]
 
-    # Overlay flagged points.
-    flagged = df[df[flag_column] != 0]
-    if not flagged.empty:
+    # Overlay flagged points. Mask the two columns needed rather than
+    # boolean-indexing ``df``, which would copy every column.
+    mask = df[flag_column].to_numpy() != 0
+    if mask.any():
         ax.scatter(  # type: ignore[reportUnknownMemberType]
-            flagged.index,
-            flagged[value_column],
+            df.index[mask],
+            df[value_column].to_numpy()[mask],
             marker="x",
             label="Flagged",
+            rasterized=True,
         )
 
     ax.set_title(  # type: ignore[reportUnknownMemberType]
@@ -80,6 +108,5 @@ def plot_series_with_flags(
 
     out_path = os.path.join(out_dir, f"{value_column}_qc.png")
     fig.savefig(out_path, dpi=150)  # type: ignore[reportUnknownMemberType]
-    plt.close(fig)
 
     return out_path
@@ -1,4 +1,5 @@
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 from hydxc.config import OutputConfig
@@ -19,36 +20,40 @@ def generate_summary(
     chart_path: str,
 ):
     total = len(df)
-    counts = df[flag_column].value_counts().to_dict()
-
-    lines = []
-    lines.append(f"# QC Summary – {out_cfg.station_name}")
-    lines.append("")
-    lines.append(f"Generated: {datetime.now().isoformat(timespec='seconds')}")
-    lines.append("")
-    lines.append("## Dataset")
-    lines.append(f"- Samples: {total}")
-    lines.append(f"- Start: {df.index.min().isoformat()}")
-    lines.append(f"- End:   {df.index.max().isoformat()}")
-    lines.append("")
-
-    lines.append("## Flag statistics")
-    for code, label in FLAG_LABELS.items():
-        n = counts.get(code, 0)
-        pct = 100 * n / total if total > 0 else 0
-        lines.append(f"- {label}: {n} ({pct:.1f}%)")
-
-    lines.append("")
-    lines.append("## Quick view")
-    lines.append(f"![QC chart]({chart_path})")
-    lines.append("")
-    lines.append("## Notes for operator")
-    lines.append("- Review flagged points before using data in reports.")
-    lines.append("- Range and spike flags may indicate real events or sensor faults.")
-    lines.append("- Stuck sensor flags usually indicate a frozen sensor or communication issue.")
-    lines.append("- Step-rate flags indicate abrupt changes that may need confirmation.")
-
-    text = "\n".join(lines)
-
-    with open(out_cfg.report_path, "w") as f:
-        f.write(text)
+    # Flag codes are small non-negative ints, so a bincount gives every
+    # code's count in one pass without building a dict.
+    counts = np.bincount(
+        df[flag_column].to_numpy(), minlength=max(FLAG_LABELS) + 1
+    )
+
+    # read_ts returns a time-sorted index, so the ends are the extremes.
+    if total > 0 and df.index.is_monotonic_increasing:
+        start, end = df.index[0], df.index[-1]
+    else:
+        start, end = df.index.min(), df.index.max()
+
+    # Lines are written straight to a buffered file rather than collected
+    # in a list and joined.
+    with open(out_cfg.report_path, "w", buffering=1 << 16) as f:
+        f.write(f"# QC Summary – {out_cfg.station_name}\n\n")
+        f.write(
+            f"Generated: {datetime.now().isoformat(timespec='seconds')}\n\n"
+        )
+        f.write("## Dataset\n")
+        f.write(f"- Samples: {total}\n")
+        f.write(f"- Start: {start.isoformat()}\n")
+        f.write(f"- End:   {end.isoformat()}\n\n")
+
+        f.write("## Flag statistics\n")
+        for code, label in FLAG_LABELS.items():
+            n = int(counts[code])
+            pct = 100 * n / total if total > 0 else 0
+            f.write(f"- {label}: {n} ({pct:.1f}%)\n")
+
+        f.write("\n## Quick view\n")
+        f.write(f"![QC chart]({chart_path})\n\n")
+        f.write("## Notes for operator\n")
+        f.write("- Review flagged points before using data in reports.\n")
+        f.write("- Range and spike flags may indicate real events or sensor faults.\n")
+        f.write("- Stuck sensor flags usually indicate a frozen sensor or communication issue.\n")
+        f.write("- Step-rate flags indicate abrupt changes that may need confirmation.")
@@ -11,19 +11,32 @@ and easy to interpret:
 * Spike MAD: spikes relative to a local Median Absolute Deviation.
 * Step rate: changes between samples that are too large.
 * Flag combination: merge multiple flag series into a single code.
+* All checks: every enabled rule plus combination in one call.
 
-All functions return an integer Series where ``0`` means "OK" and
+All functions return an ``int8`` Series where ``0`` means "OK" and
 non-zero codes refer to specific QC rules defined by the constants
-below.
+below. The codes are tiny, so ``int8`` keeps flag arrays at one byte per
+sample.
 """
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import numpy as np
 import pandas as pd
 from pandas import Series
 
-# Flag codes (0 = OK, >0 = increasingly "severe"/specific).
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from hydxc.config import QCConfig
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+# Flag codes (0 = OK, >0 = increasingly "severe"/specific). Plain ints
+# fit int8, so assigning them into int8 flag arrays never upcasts.
 FLAG_OK: int = 0
 FLAG_RANGE: int = 1
 FLAG_STUCK: int = 2
@@ -32,6 +45,10 @@ FLAG_STEP: int = 4
 
 FlagSeries = Series  # convenience alias
 
+# Rows of the sliding-window view processed per block in the NumPy spike
+# MAD path; bounds the temporary (rows x window) arrays np.median creates.
+_SPIKE_BLOCK_ROWS: int = 65536
+
 
 def apply_range_check(series: Series, min_val: float, max_val: float) -> FlagSeries:
     """
@@ -52,12 +69,16 @@ def apply_range_check(series: Series, min_val: float, max_val: float) -> FlagSer
     Returns
     -------
     pandas.Series
-        Integer Series of flags aligned to ``series.index``.
+        ``int8`` Series of flags aligned to ``series.index``.
     """
-    flags = pd.Series(FLAG_OK, index=series.index, dtype="int64")
-    mask = (series < min_val) | (series > max_val)
-    flags[mask] = FLAG_RANGE
-    return flags
+    # Work on the raw array: one comparison result is reused as the mask
+    # buffer, with no intermediate bool Series or index alignment.
+    arr = series.to_numpy(dtype=float)
+    mask = np.less(arr, min_val)
+    np.logical_or(mask, np.greater(arr, max_val), out=mask)
+    flags = np.zeros(arr.size, dtype=np.int8)
+    np.copyto(flags, FLAG_RANGE, where=mask)
+    return pd.Series(flags, index=series.index)
 
 
 def apply_stuck_sensor(series: Series, window: int, tolerance: float) -> FlagSeries:
@@ -84,9 +105,15 @@ def apply_stuck_sensor(series: Series, window: int, tolerance: float) -> FlagSer
     Returns
     -------
     pandas.Series
-        Integer Series of flags aligned to ``series.index``.
+        ``int8`` Series of flags aligned to ``series.index``.
     """
-    flags = pd.Series(FLAG_OK, index=series.index, dtype="int64")
+    if _stuck_kernel is not None and window >= 1:
+        arr = series.to_numpy(dtype=float)
+        out = np.zeros(arr.size, dtype=np.int8)
+        _stuck_kernel(arr, window, tolerance, FLAG_STUCK, out)
+        return pd.Series(out, index=series.index)
+
+    flags = pd.Series(FLAG_OK, index=series.index, dtype=np.int8)
     rolling_max = series.rolling(window=window, min_periods=window).max() # pyright: ignore[reportUnknownMemberType]
     rolling_min = series.rolling(window=window, min_periods=window).min() # pyright: ignore[reportUnknownMemberType]
     stuck = (rolling_max - rolling_min).abs() <= tolerance
@@ -112,6 +139,337 @@ def _rolling_mad(x: np.ndarray) -> float:
     return float(np.median(np.abs(x - median)))
 
 
+def _insert_sorted(buf: np.ndarray, count: int, value: float) -> None:
+    """Insert ``value`` into the sorted prefix ``buf[:count]``."""
+    j = count
+    while j > 0 and buf[j - 1] > value:
+        buf[j] = buf[j - 1]
+        j -= 1
+    buf[j] = value
+
+
+def _bisect_left(buf: np.ndarray, count: int, value: float) -> int:
+    """First index of ``buf[:count]`` (sorted) whose item is >= ``value``."""
+    lo = 0
+    hi = count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if buf[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def _remove_sorted(buf: np.ndarray, count: int, value: float) -> None:
+    """Remove one occurrence of ``value`` from the sorted ``buf[:count]``."""
+    for j in range(_bisect_left(buf, count, value), count - 1):
+        buf[j] = buf[j + 1]
+
+
+def _sorted_median(buf: np.ndarray, count: int) -> float:
+    """Median of the sorted prefix ``buf[:count]``, as ``np.median``."""
+    mid = count // 2
+    if count % 2:
+        return buf[mid]
+    return (buf[mid - 1] + buf[mid]) / 2.0
+
+
+def _sorted_mad(buf: np.ndarray, count: int, median: float) -> float:
+    """
+    Median absolute deviation of the sorted ``buf[:count]`` from ``median``.
+
+    The deviations of the items below ``median`` (walking down) and of
+    those at or above it (walking up) are each already in ascending
+    order, so merging the two walks up to the middle rank yields the
+    median deviation without sorting.
+    """
+    below = _bisect_left(buf, count, median) - 1
+    above = below + 1
+    prev = 0.0
+    dev = 0.0
+    for _ in range(count // 2 + 1):
+        prev = dev
+        if above >= count or (
+            below >= 0 and median - buf[below] <= buf[above] - median
+        ):
+            dev = median - buf[below]
+            below -= 1
+        else:
+            dev = buf[above] - median
+            above += 1
+    if count % 2:
+        return dev
+    return (prev + dev) / 2.0
+
+
+def _spike_mad_loop(
+    arr: np.ndarray,
+    half: int,
+    threshold: float,
+    flag: int,
+    out: np.ndarray,
+) -> None:
+    """
+    Write ``flag`` into ``out`` wherever ``arr`` has a MAD spike.
+
+    Scalar kernel behind :func:`apply_spike_mad`, compiled with Numba when
+    it is installed. The non-NaN values of the centred window are kept in
+    a sorted buffer that slides with ``i``: each step inserts the sample
+    entering the window and removes the one leaving it, instead of
+    sorting every window from scratch. The median is read off the middle
+    of the buffer and the MAD found with :func:`_sorted_mad`. Windows
+    containing NaN are not diagnostic, matching ``np.median``'s NaN
+    propagation.
+    """
+    n = arr.size
+    # A half-width of n already spans the whole series from every sample,
+    # so a larger one gives the same windows; clamping it bounds the loop
+    # below, and the buffer never holds more than n values.
+    half = min(half, n)
+    buf = np.empty(min(2 * half + 1, n))
+    count = 0
+    nan_count = 0
+
+    for i in range(-half, n):
+        # Window of sample i is [i - half, i + half], clipped to the data.
+        entering = i + half
+        if entering < n:
+            value = arr[entering]
+            if np.isnan(value):
+                nan_count += 1
+            else:
+                _insert_sorted(buf, count, value)
+                count += 1
+        leaving = i - half - 1
+        if leaving >= 0:
+            value = arr[leaving]
+            if np.isnan(value):
+                nan_count -= 1
+            else:
+                _remove_sorted(buf, count, value)
+                count -= 1
+
+        if i < 0 or nan_count > 0 or count < 3:
+            continue
+
+        median = _sorted_median(buf, count)
+        if not np.isfinite(median):
+            # An infinite median gives NaN deviations, so no finite MAD.
+            continue
+        mad = _sorted_mad(buf, count, median)
+        if mad != 0.0 and abs(arr[i] - median) / mad > threshold:
+            out[i] = flag
+
+
+def _stuck_loop(
+    arr: np.ndarray,
+    window: int,
+    tolerance: float,
+    flag: int,
+    out: np.ndarray,
+) -> None:
+    """
+    Write ``flag`` into ``out`` wherever the sensor looks stuck.
+
+    Scalar kernel behind :func:`apply_stuck_sensor`, compiled with Numba
+    when it is installed. One O(N) sweep replaces the two rolling
+    max/min passes and their float result arrays.
+    """
+    if window > arr.size:
+        # No window is ever full, so nothing can be flagged; this also
+        # keeps the ring buffers below no larger than the data.
+        return
+
+    # The rolling max and min over the trailing ``window`` samples are
+    # kept in two monotonic deques of indices, ring buffers of ``window``
+    # slots, so each sample is pushed and popped at most once. Ring
+    # positions wrap with a compare rather than ``%`` (integer division).
+    max_q = np.empty(window, dtype=np.int64)
+    min_q = np.empty(window, dtype=np.int64)
+    max_head = max_len = min_head = min_len = 0
+    nan_count = 0
+
+    for i in range(arr.size):
+        value = arr[i]
+
+        # Drop indices that have left the window [i - window + 1, i].
+        while max_len > 0 and max_q[max_head] <= i - window:
+            max_head += 1
+            if max_head == window:
+                max_head = 0
+            max_len -= 1
+        while min_len > 0 and min_q[min_head] <= i - window:
+            min_head += 1
+            if min_head == window:
+                min_head = 0
+            min_len -= 1
+
+        if i >= window and np.isnan(arr[i - window]):
+            nan_count -= 1
+        if np.isnan(value):
+            nan_count += 1
+        else:
+            tail = max_head + max_len - 1
+            if tail >= window:
+                tail -= window
+            while max_len > 0 and arr[max_q[tail]] <= value:
+                max_len -= 1
+                tail = tail - 1 if tail > 0 else window - 1
+            tail = tail + 1 if tail < window - 1 else 0
+            max_q[tail] = i
+            max_len += 1
+
+            tail = min_head + min_len - 1
+            if tail >= window:
+                tail -= window
+            while min_len > 0 and arr[min_q[tail]] >= value:
+                min_len -= 1
+                tail = tail - 1 if tail > 0 else window - 1
+            tail = tail + 1 if tail < window - 1 else 0
+            min_q[tail] = i
+            min_len += 1
+
+        # Like pandas rolling(min_periods=window), a window that is not
+        # yet full or contains NaN is never flagged.
+        if (
+            i >= window - 1
+            and nan_count == 0
+            and abs(arr[max_q[max_head]] - arr[min_q[min_head]]) <= tolerance
+        ):
+            out[i] = flag
+
+
+def _fused_qc_loop(
+    arr: np.ndarray,
+    range_on: bool,
+    min_val: float,
+    max_val: float,
+    stuck_on: bool,
+    stuck_window: int,
+    stuck_tol: float,
+    spike_on: bool,
+    spike_half: int,
+    spike_threshold: float,
+    step_on: bool,
+    max_change_per_step: float,
+    out: np.ndarray,
+) -> None:
+    """
+    Evaluate every enabled rule into ``out`` in one compiled call.
+
+    Scalar kernel behind :func:`apply_all_checks`. Each sample gets the
+    highest applicable flag code. The windowed rules keep sliding state
+    that must see every sample, so they run as their own sweeps, lowest
+    code first so the spike sweep overwrites stuck flags; a final sweep
+    then applies the step and range rules around them.
+    """
+    if stuck_on and stuck_window >= 1:
+        _stuck_loop(arr, stuck_window, stuck_tol, FLAG_STUCK, out)
+    if spike_on:
+        _spike_mad_loop(arr, spike_half, spike_threshold, FLAG_SPIKE, out)
+
+    for i in range(arr.size):
+        value = arr[i]
+
+        if step_on and i > 0 and abs(value - arr[i - 1]) > max_change_per_step:
+            out[i] = FLAG_STEP
+        elif (
+            range_on
+            and out[i] == FLAG_OK
+            and (value < min_val or value > max_val)
+        ):
+            out[i] = FLAG_RANGE
+
+
+if njit is not None:
+    _insert_sorted = njit(cache=True, boundscheck=False)(_insert_sorted)
+    _bisect_left = njit(cache=True, boundscheck=False)(_bisect_left)
+    _remove_sorted = njit(cache=True, boundscheck=False)(_remove_sorted)
+    _sorted_median = njit(cache=True, boundscheck=False)(_sorted_median)
+    _sorted_mad = njit(cache=True, boundscheck=False)(_sorted_mad)
+    _spike_mad_loop = njit(cache=True, boundscheck=False)(_spike_mad_loop)
+    _spike_mad_kernel = _spike_mad_loop
+    _stuck_loop = njit(cache=True, boundscheck=False)(_stuck_loop)
+    _stuck_kernel = _stuck_loop
+    _fused_qc_kernel = njit(cache=True, boundscheck=False)(_fused_qc_loop)
+else:  # pragma: no cover - optional dependency
+    _spike_mad_kernel = None
+    _stuck_kernel = None
+    _fused_qc_kernel = None
+
+# Whether the compiled (Numba) rule kernels are available.
+HAVE_NUMBA: bool = njit is not None
+
+
+def _spike_mad_scalar(
+    arr: np.ndarray,
+    indices: range,
+    half: int,
+    threshold: float,
+    flag: int,
+    out: np.ndarray,
+) -> None:
+    """Per-sample MAD spike check for ``indices`` using ``np.median``."""
+    n = len(arr)
+
+    for i in indices:
+        start = max(0, i - half)
+        end = min(n, i + half + 1)
+        window_vals = arr[start:end]
+
+        if window_vals.size < 3:
+            continue
+
+        median = float(np.median(window_vals))
+        mad = _rolling_mad(window_vals)
+        if mad == 0.0:
+            continue
+
+        score = abs(arr[i] - median) / mad
+        if score > threshold:
+            out[i] = flag
+
+
+def _spike_mad_numpy(
+    arr: np.ndarray,
+    half: int,
+    threshold: float,
+    flag: int,
+    out: np.ndarray,
+) -> None:
+    """
+    Vectorised NumPy equivalent of :func:`_spike_mad_loop` (no Numba).
+
+    Samples with a full ``2 * half + 1`` window are scored in blocks from
+    a sliding-window view, one ``np.median(..., axis=1)`` per block; only
+    the truncated windows at either edge go through a Python loop.
+    """
+    n = arr.size
+    window = 2 * half + 1
+    if window < 3:
+        return
+    if n < window:
+        _spike_mad_scalar(arr, range(n), half, threshold, flag, out)
+        return
+
+    _spike_mad_scalar(arr, range(half), half, threshold, flag, out)
+    _spike_mad_scalar(arr, range(n - half, n), half, threshold, flag, out)
+
+    # Row r of the view is the window centred on sample r + half.
+    windows = np.lib.stride_tricks.sliding_window_view(arr, window)
+    for row in range(0, len(windows), _SPIKE_BLOCK_ROWS):
+        block = windows[row : row + _SPIKE_BLOCK_ROWS]
+        median = np.median(block, axis=1)
+        mad = np.median(np.abs(block - median[:, None]), axis=1)
+
+        centre = arr[row + half : row + half + len(block)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.abs(centre - median) / mad
+        spikes = (mad != 0.0) & (score > threshold)
+        out[row + half : row + half + len(block)][spikes] = flag
+
+
 def apply_spike_mad(series: Series, window: int, threshold: float) -> FlagSeries:
     """
     Flag spikes based on a local Median Absolute Deviation (MAD) score.
@@ -139,32 +497,17 @@ def apply_spike_mad(series: Series, window: int, threshold: float) -> FlagSeries
     Returns
     -------
     pandas.Series
-        Integer Series of flags aligned to ``series.index``.
+        ``int8`` Series of flags aligned to ``series.index``.
     """
-    flags = pd.Series(FLAG_OK, index=series.index, dtype="int64")
     arr = series.to_numpy(dtype=float)
+    out = np.zeros(arr.size, dtype=np.int8)
 
-    half = window // 2
-    n = len(arr)
-
-    for i in range(n):
-        start = max(0, i - half)
-        end = min(n, i + half + 1)
-        window_vals = arr[start:end]
-
-        if window_vals.size < 3:
-            continue
-
-        median = float(np.median(window_vals))
-        mad = _rolling_mad(window_vals)
-        if mad == 0.0:
-            continue
-
-        score = abs(arr[i] - median) / mad
-        if score > threshold:
-            flags.iloc[i] = FLAG_SPIKE
+    if _spike_mad_kernel is not None:
+        _spike_mad_kernel(arr, window // 2, threshold, FLAG_SPIKE, out)
+    else:  # pragma: no cover - optional dependency
+        _spike_mad_numpy(arr, window // 2, threshold, FLAG_SPIKE, out)
 
-    return flags
+    return pd.Series(out, index=series.index)
 
 
 def apply_step_rate(series: Series, max_change_per_step: float) -> FlagSeries:
@@ -185,13 +528,20 @@ def apply_step_rate(series: Series, max_change_per_step: float) -> FlagSeries:
     Returns
     -------
     pandas.Series
-        Integer Series of flags aligned to ``series.index``.
+        ``int8`` Series of flags aligned to ``series.index``.
     """
-    flags = pd.Series(FLAG_OK, index=series.index, dtype="int64")
-    diff = series.diff().abs()
-    mask: Series = diff > max_change_per_step # pyright: ignore[reportOperatorIssue]
-    flags[mask] = FLAG_STEP
-    return flags
+    arr = series.to_numpy(dtype=float)
+    flags = np.zeros(arr.size, dtype=np.int8)
+    if arr.size > 1:
+        # The first sample has no predecessor and is never flagged, so the
+        # differences are written against flags[1:]; abs is taken in place.
+        # inf - inf is NaN and never flagged; silence the "invalid value"
+        # warning for it, as Series.diff did.
+        with np.errstate(invalid="ignore"):
+            step = np.subtract(arr[1:], arr[:-1])
+        np.abs(step, out=step)
+        np.copyto(flags[1:], FLAG_STEP, where=step > max_change_per_step)
+    return pd.Series(flags, index=series.index)
 
 
 def combine_flags(*flag_series: FlagSeries) -> FlagSeries:
@@ -213,7 +563,7 @@ def combine_flags(*flag_series: FlagSeries) -> FlagSeries:
     Returns
     -------
     pandas.Series
-        Integer Series of combined flags aligned to the common index.
+        ``int8`` Series of combined flags aligned to the common index.
 
     Raises
     ------
@@ -232,9 +582,93 @@ def combine_flags(*flag_series: FlagSeries) -> FlagSeries:
                 "and cannot be safely combined."
             )
 
-    # Stack into a DataFrame and take row-wise max.
-    frame = pd.concat(flag_series, axis=1)
-    combined = frame.max(axis=1).astype("int64")
-    combined.name = flag_series[0].name or "qc_flag"
+    # Elementwise max over the raw arrays, accumulated in place into one
+    # output array. (np.maximum.reduce over a list would first stack the
+    # inputs into a K x N copy.)
+    combined_arr = flag_series[0].to_numpy(dtype=np.int8, copy=True)
+    for fs in flag_series[1:]:
+        np.maximum(
+            combined_arr,
+            fs.to_numpy(dtype=np.int8, copy=False),
+            out=combined_arr,
+        )
+
+    return pd.Series(
+        combined_arr,
+        index=reference_index,
+        name=flag_series[0].name or "qc_flag",
+    )
+
+
+def apply_all_checks(series: Series, cfg: QCConfig) -> FlagSeries:
+    """
+    Apply every QC rule enabled in ``cfg`` and combine the flags.
+
+    The result is the same as calling each enabled ``apply_*`` function
+    and passing the results to :func:`combine_flags`. When Numba is
+    installed, all rules are evaluated in one compiled call that writes
+    straight into a single flag array, instead of materialising one flag
+    Series per rule and reducing them afterwards.
+
+    Parameters
+    ----------
+    series
+        Numeric pandas Series to check.
+    cfg
+        QC configuration; only the rule sections are used.
+
+    Returns
+    -------
+    pandas.Series
+        ``int8`` Series of combined flags aligned to ``series.index``.
+        All samples are ``FLAG_OK`` if no rule is enabled.
+    """
+    if _fused_qc_kernel is None:  # pragma: no cover - optional dependency
+        flag_series = []
+        if cfg.range_check.enabled:
+            flag_series.append(
+                apply_range_check(
+                    series, cfg.range_check.min, cfg.range_check.max
+                )
+            )
+        if cfg.stuck_sensor.enabled:
+            flag_series.append(
+                apply_stuck_sensor(
+                    series, cfg.stuck_sensor.window, cfg.stuck_sensor.tolerance
+                )
+            )
+        if cfg.spike_mad.enabled:
+            flag_series.append(
+                apply_spike_mad(
+                    series, cfg.spike_mad.window, cfg.spike_mad.threshold
+                )
+            )
+        if cfg.step_rate.enabled:
+            flag_series.append(
+                apply_step_rate(series, cfg.step_rate.max_change_per_step)
+            )
+        if flag_series:
+            return combine_flags(*flag_series)
+        return pd.Series(
+            FLAG_OK, index=series.index, dtype=np.int8, name="qc_flag"
+        )
 
-    return combined
+    arr = series.to_numpy(dtype=float)
+    out = np.zeros(arr.size, dtype=np.int8)
+    _fused_qc_kernel(
+        arr,
+        cfg.range_check.enabled,
+        cfg.range_check.min,
+        cfg.range_check.max,
+        cfg.stuck_sensor.enabled,
+        cfg.stuck_sensor.window,
+        cfg.stuck_sensor.tolerance,
+        cfg.spike_mad.enabled,
+        cfg.spike_mad.window // 2,
+        cfg.spike_mad.threshold,
+        cfg.step_rate.enabled,
+        cfg.step_rate.max_change_per_step,
+        out,
+    )
+
+    return pd.Series(out, index=series.index, name="qc_flag")